@@ -0,0 +1,155 @@
+"""
+Shared plumbing for the upload, end-to-end, intake and debug test scripts
+Result logging, the summary report, form helpers and in-memory test images
+"""
+
+from playwright.sync_api import expect
+from collections import Counter
+from functools import cache
+from pathlib import Path
+import json
+import os
+
+# Smallest valid PNG (1x1 RGBA). The uploader only checks the image/* type,
+# so nothing needs real pixels and no imaging library is required.
+MINI_PNG = bytes.fromhex(
+    '89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c4'
+    '890000000d4944415478da63489976e23f0005e602c2e02778f9000000004945'
+    '4e44ae426082'
+)
+
+# Web font and tracker hosts no test asserts on. They fail DNS resolution
+# instead of being routed, because any context.route() turns off the HTTP cache.
+THIRD_PARTY_HOSTS = (
+    'fonts.googleapis.com',
+    'fonts.gstatic.com',
+    '*.google-analytics.com',
+    '*.googletagmanager.com',
+    '*.segment.io',
+)
+
+# Chromium subsystems form tests never need; /dev/shm is tiny in containers
+CHROMIUM_ARGS = (
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--host-resolver-rules=' + ', '.join(f'MAP {host} ~NOTFOUND' for host in THIRD_PARTY_HOSTS),
+)
+
+# Sets every field in a single round-trip to the browser. Values are strings
+# for inputs, textareas and selects, and booleans for radios and checkboxes.
+FILL_FORM_JS = """(entries) => {
+    for (const [selector, value] of entries) {
+        const el = document.querySelector(selector);
+        if (el.type === 'checkbox' || el.type === 'radio') {
+            el.checked = value;
+        } else {
+            el.value = value;
+        }
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+}"""
+
+def fill_form(page, fields):
+    """Fill a {selector: value} mapping of form fields in one evaluate call"""
+    page.evaluate(FILL_FORM_JS, list(fields.items()))
+
+@cache
+def png_payloads(count, prefix='test_image'):
+    """Build in-memory upload payloads so nothing touches the filesystem"""
+    return tuple(
+        {'name': f'{prefix}_{i+1}.png', 'mimeType': 'image/png', 'buffer': MINI_PNG}
+        for i in range(count)
+    )
+
+class BaseTester:
+    REPORT_TITLE = "TEST REPORT"
+    # When set, generate_report() also writes the raw results here as JSON
+    RESULTS_FILE = None
+
+    def __init__(self, base_url='http://localhost:5173'):
+        self.base_url = base_url
+        self.test_results = []
+        self.counts = Counter()
+
+    def log_test(self, test_name, status, details=""):
+        """Log test result"""
+        result = {
+            'test': test_name,
+            'status': status,
+            'details': details
+        }
+        self.test_results.append(result)
+        self.counts[status] += 1
+        status_symbol = "✓" if status == "PASS" else "✗" if status == "FAIL" else "ℹ"
+        self.emit(f"{status_symbol} {test_name}: {details}")
+
+    def emit(self, line):
+        """Write one line of progress output"""
+        print(line)
+
+    def merge_results(self, results):
+        """Fold in results logged by a worker process"""
+        self.test_results.extend(results)
+        self.counts.update(r['status'] for r in results)
+
+    def new_context(self, browser, **options):
+        """Open a context with service workers blocked"""
+        return browser.new_context(service_workers='block', **options)
+
+    def open_form(self, page):
+        """Navigate to the form and wait until the upload widget is rendered"""
+        page.goto(self.base_url, wait_until='domcontentloaded')
+        expect(page.locator('#drop-zone')).to_be_visible(timeout=5000)
+
+    def open_form_with_files(self, page, files):
+        """Open a fresh form and upload files, returning once the preview renders
+
+        Each test needs its own load: FileUploader appends to its file list and
+        clearing the input doesn't reset it, so a shared page would leak files.
+        """
+        self.open_form(page)
+        page.locator('#file-input').set_input_files(files)
+        expect(page.locator('#file-preview')).to_be_visible()
+
+    def maybe_screenshot(self, page, name):
+        """Save a debug screenshot, only when PW_DEBUG_SCREENSHOTS is set"""
+        if not os.environ.get('PW_DEBUG_SCREENSHOTS'):
+            return
+        Path('test-screenshots').mkdir(exist_ok=True)
+        path = f'test-screenshots/{name}.png'
+        page.screenshot(path=path)
+        print(f"Screenshot saved: {path}")
+
+    def generate_report(self):
+        """Generate test summary report"""
+        print("\n" + "="*60)
+        print(self.REPORT_TITLE)
+        print("="*60)
+
+        passed = self.counts['PASS']
+        failed = self.counts['FAIL']
+        info = self.counts['INFO']
+        total = len(self.test_results)
+
+        print(f"\nTotal Tests: {total}")
+        print(f"Passed: {passed} ✓")
+        print(f"Failed: {failed} ✗")
+        print(f"Info: {info} ℹ")
+
+        if failed > 0:
+            print("\n❌ FAILED TESTS:")
+            for result in self.test_results:
+                if result['status'] == 'FAIL':
+                    print(f"  - {result['test']}: {result['details']}")
+        else:
+            print("\n✅ ALL TESTS PASSED!")
+
+        print("\n" + "="*60)
+
+        if self.RESULTS_FILE:
+            Path(self.RESULTS_FILE).write_text(json.dumps(self.test_results, indent=2))
+            print(f"Results written to {self.RESULTS_FILE}")
@@ -245,9 +245,8 @@ class FileUploader {
   }
 
   async uploadAll() {
-    this.uploadedUrls = [];
-
-    for (const file of this.files) {
+    // Upload all files concurrently; URLs keep the order of this.files
+    const urls = await Promise.all(this.files.map(async (file) => {
       const formData = new FormData();
       formData.append('file', file);
       formData.append('type', 'image');
@@ -260,13 +259,15 @@ class FileUploader {
 
         if (response.ok) {
           const data = await response.json();
-          this.uploadedUrls.push(data.url);
+          return data.url;
         }
       } catch (error) {
         console.error('File upload error:', error);
       }
-    }
+      return null;
+    }));
 
+    this.uploadedUrls = urls.filter(Boolean);
     return this.uploadedUrls;
   }
 
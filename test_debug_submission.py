@@ -3,94 +3,102 @@
 Debug test to capture console logs and network errors
 """
 
-from playwright.sync_api import sync_playwright
-import tempfile
-from PIL import Image
-import os
-
-def create_test_image():
-    """Create a single test image"""
-    temp_dir = tempfile.mkdtemp()
-    img = Image.new('RGB', (400, 300), color=(100, 150, 200))
-    filepath = os.path.join(temp_dir, 'test_image.png')
-    img.save(filepath)
-    return filepath
+from playwright.sync_api import sync_playwright, expect
+from base_tester import fill_form, png_payloads
+from pathlib import Path
+from collections import deque
+
+# Uploaded straight from memory; no imaging library needed
+TEST_IMAGE = png_payloads(1)[0]
 
 def test_submission_with_debug():
     print("=== Debugging Form Submission ===\n")
 
-    test_file = create_test_image()
-    console_logs = []
+    # Bounded buffers of raw event fields; formatting happens once at the end
+    console_logs = deque(maxlen=200)
     network_failures = []
-    network_requests = []
+    network_requests = deque(maxlen=10)
+    network_responses = deque(maxlen=64)
 
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)  # Headless for automated testing
         page = browser.new_page()
 
         # Capture console messages
-        page.on('console', lambda msg: console_logs.append(f"[{msg.type}] {msg.text}"))
+        page.on('console', lambda msg: console_logs.append((msg.type, msg.text)))
 
         # Capture network failures
-        page.on('requestfailed', lambda request: network_failures.append(f"FAILED: {request.method} {request.url} - {request.failure}"))
+        page.on('requestfailed', lambda request: network_failures.append((request.method, request.url, request.failure)))
 
         # Capture all network requests
-        page.on('request', lambda request: network_requests.append(f"→ {request.method} {request.url}"))
-        page.on('response', lambda response: print(f"← {response.status} {response.url}"))
+        page.on('request', lambda request: network_requests.append((request.method, request.url)))
+
+        # Only API calls and errors are worth reporting out of Vite's asset chatter
+        def record_response(response):
+            if '/api/' in response.url or response.status >= 400:
+                network_responses.append((response.status, response.url))
+
+        page.on('response', record_response)
 
         # Navigate
         print("Navigating to form...")
-        page.goto('http://localhost:5173')
-        page.wait_for_load_state('networkidle')
+        page.goto('http://localhost:5173', wait_until='domcontentloaded')
+        expect(page.locator('#name')).to_be_visible()
 
         # Fill minimum required fields
         print("\nFilling form...")
-        page.locator('#name').fill('Debug Test')
-        page.locator('#email').fill('debug@test.com')
-        page.locator('#company').fill('Debug Co')
-        page.locator('#business-description').fill('Testing submission')
-        page.locator('#project-type').select_option('landing-page')
+        fill_form(page, {
+            '#name': 'Debug Test',
+            '#email': 'debug@test.com',
+            '#company': 'Debug Co',
+            '#business-description': 'Testing submission',
+            '#project-type': 'landing-page',
+        })
 
         # Add file
         print("Adding file...")
-        page.locator('#file-input').set_input_files(test_file)
-        page.wait_for_timeout(1000)
+        page.locator('#file-input').set_input_files(TEST_IMAGE)
+        expect(page.locator('#file-count')).to_contain_text('1 file selected')
 
         print("\nSubmitting form...")
         submit_btn = page.locator('button[type="submit"]')
         submit_btn.click()
 
         # Wait and observe
-        print("\nWaiting for response (30 seconds)...")
-        page.wait_for_timeout(30000)
+        print("\nWaiting for response (up to 30 seconds)...")
+        try:
+            page.wait_for_url('**/thank-you.html', timeout=30000)
+        except Exception:
+            print("No redirect to thank-you page within 30 seconds")
 
         print(f"\n=== Final URL: {page.url} ===")
 
         # Print diagnostics
         print("\n=== Console Logs ===")
-        for log in console_logs:
-            print(log)
+        for msg_type, text in console_logs:
+            print(f"[{msg_type}] {text}")
 
         print("\n=== Network Failures ===")
         if network_failures:
-            for failure in network_failures:
-                print(failure)
+            for method, url, failure in network_failures:
+                print(f"FAILED: {method} {url} - {failure}")
         else:
             print("No network failures")
 
-        print("\n=== Network Requests (last 10) ===")
-        for req in network_requests[-10:]:
-            print(req)
+        print(f"\n=== Network Requests (last {network_requests.maxlen}) ===")
+        for method, url in network_requests:
+            print(f"→ {method} {url}")
+
+        print(f"\n=== API & Error Responses (last {network_responses.maxlen}) ===")
+        for status, url in network_responses:
+            print(f"← {status} {url}")
 
         # Take final screenshot
-        page.screenshot(path='test-screenshots/debug-final.png')
-        print("\nScreenshot saved: test-screenshots/debug-final.png")
+        Path('test-screenshots').mkdir(exist_ok=True)
+        page.screenshot(path='test-screenshots/debug-final.jpg', type='jpeg', quality=60)
+        print("\nScreenshot saved: test-screenshots/debug-final.jpg")
 
         browser.close()
 
-    # Cleanup
-    if os.path.exists(test_file):
-        os.remove(test_file)
-
 if __name__ == '__main__':
     test_submission_with_debug()
@@ -4,61 +4,166 @@ Edge case testing and visual regression tests
 Tests form behavior with edge cases, invalid inputs, and captures visual snapshots
 """
 
-from playwright.sync_api import sync_playwright, expect
+from playwright.async_api import async_playwright, expect
+from base_tester import FILL_FORM_JS, BaseTester
+from contextvars import ContextVar
+from multiprocessing import Pool
+from pathlib import Path
+import argparse
+import asyncio
+import math
 import os
+import sys
+
+# Upper bound on tests driving their own browser context at the same time,
+# per worker process
+MAX_PARALLEL_TESTS = 4
+
+# Form states captured by test_visual_snapshots, as fill_form() input
+PARTIAL_FORM_DATA = {
+    '#name': 'John Doe',
+    '#email': 'john@example.com',
+    '#company': 'Tech Corp',
+}
+COMPLETE_FORM_DATA = {
+    **PARTIAL_FORM_DATA,
+    '#phone': '555-1234',
+    '#business-description': 'We build amazing software',
+    '#current-website': 'https://techcorp.example.com',
+    '#project-type': 'standard-site',
+    '#pages-needed': 'Home, About, Services, Contact',
+    '#features': 'Blog, Contact form, Gallery',
+    'input[name="has-logo"][value="yes"]': True,
+    'input[name="has-photos"][value="yes"]': True,
+    'input[name="has-copy"][value="yes"]': True,
+    '#inspiration': 'https://stripe.com\nhttps://linear.app',
+    '#timeline': '2-4-weeks',
+    '#budget': '4k-6k',
+    'input[name="post-launch"][value="maintenance"]': True,
+    '#additional': 'Looking forward to working together!',
+    '#referral': 'LinkedIn',
+}
+
+# Snapshots are for eyeballing, not pixel diffs, so JPEG's cheaper encoding
+# and smaller files win over lossless PNG
+SCREENSHOT_OPTIONS = {'type': 'jpeg', 'quality': 60}
+
+# Images and fonts no assertion depends on; only the visual snapshots load
+# them. Matching by extension keeps every other request out of the route handler.
+HEAVY_ASSET_GLOB = '**/*.{png,jpg,jpeg,gif,svg,webp,ico,woff,woff2,ttf}'
+
+async def block_heavy_assets(route):
+    """Abort an image or font request"""
+    await route.abort()
+
+async def fill_form(page, fields):
+    """Fill form fields from a {selector: value} dict with one evaluate call"""
+    await page.evaluate(FILL_FORM_JS, list(fields.items()))
+
+# Output lines of the test running in the current asyncio task. Tests run
+# concurrently, so each buffers its own and writes them out as one block.
+test_output = ContextVar('test_output')
+
+class EdgeCaseVisualTester(BaseTester):
+    REPORT_TITLE = "EDGE CASE & VISUAL TEST REPORT"
+    TESTS = (
+        'test_empty_form_submission',
+        'test_invalid_email_format',
+        'test_very_long_text_input',
+        'test_special_characters_in_fields',
+        'test_url_validation',
+        'test_visual_snapshots',
+        'test_mobile_viewport_interactions',
+        'test_rapid_field_changes',
+        'test_tab_navigation',
+        'test_accessibility_features',
+        'test_form_persistence_on_reload',
+    )
 
-class EdgeCaseVisualTester:
     def __init__(self, base_url='http://localhost:5173'):
-        self.base_url = base_url
-        self.test_results = []
+        super().__init__(base_url)
         self.screenshot_dir = '/Users/brian/AI/business/briancline-co/intake/test-screenshots'
+        # Filled in by warm_up() before any test runs
+        self.storage_state = None
+        self.form_html = None
 
-    def log_test(self, test_name, status, details=""):
-        """Log test result"""
-        result = {
-            'test': test_name,
-            'status': status,
-            'details': details
-        }
-        self.test_results.append(result)
-        status_symbol = "✓" if status == "PASS" else "✗" if status == "FAIL" else "ℹ"
-        print(f"{status_symbol} {test_name}: {details}")
+    def emit(self, line):
+        """Buffer a line with the rest of the running test's output"""
+        test_output.get().append(line)
 
     def setup_screenshot_dir(self):
         """Create screenshot directory if it doesn't exist"""
-        if not os.path.exists(self.screenshot_dir):
-            os.makedirs(self.screenshot_dir)
+        Path(self.screenshot_dir).mkdir(parents=True, exist_ok=True)
 
-    def test_empty_form_submission(self, page):
-        """Test submitting an empty form"""
-        print("\n=== Testing Empty Form Submission ===")
+    async def warm_up(self, browser):
+        """Load the form once and snapshot its state for the test contexts"""
+        context = await browser.new_context()
+        try:
+            page = await context.new_page()
+            await page.goto(self.base_url)
+
+            # The first request makes Vite transform main.js and the Tailwind
+            # CSS; doing it here keeps concurrent tests off a cold dev server
+            self.storage_state = await context.storage_state()
+            self.form_html = await page.content()
+        finally:
+            await context.close()
+
+    async def open_form(self, page, wait_until='domcontentloaded'):
+        """Navigate to the live form and wait until it is rendered"""
+        await page.goto(self.base_url, wait_until=wait_until)
+        await expect(page.locator('#name')).to_be_visible()
+
+    async def open_snapshot(self, context):
+        """Open a page rendering the cached form HTML without touching the dev server
+
+        Scripts and stylesheets don't load from the snapshot, so it only suits
+        tests that exercise plain HTML5 form behavior.
+        """
+        page = await context.new_page()
+        await page.set_content(self.form_html, wait_until='domcontentloaded')
+        return page
+
+    async def check_field_validity(self, context, selector, value):
+        """Fill a single field on its own page and return whether the browser accepts it"""
+        page = await self.open_snapshot(context)
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
+            field = page.locator(selector)
+            await field.fill(value)
+            return await field.evaluate('el => el.validity.valid')
+        finally:
+            await page.close()
 
-            submit_btn = page.locator('button[type="submit"]')
-            submit_btn.click()
+    async def test_empty_form_submission(self, context):
+        """Test submitting an empty form"""
+        page = await context.new_page()
+        self.emit("\n=== Testing Empty Form Submission ===")
+        try:
+            await self.open_form(page)
 
-            # Browser should prevent submission due to required fields
-            # Wait a moment to see if page stays the same
-            page.wait_for_timeout(500)
+            # Empty required fields match :invalid from the start, but only a
+            # submit attempt makes them :user-invalid
+            flagged = page.locator('#intake-form :user-invalid')
+            await expect(flagged).to_have_count(0)
 
-            # Check we're still on the same page (not redirected)
-            assert page.url == self.base_url or page.url == f'{self.base_url}/'
+            submit_btn = page.locator('button[type="submit"]')
+            await submit_btn.click()
+
+            # Browser should flag every required field and keep the submit
+            # handler from running; it would disable and relabel the button
+            required_count = await page.locator('#intake-form [required]').count()
+            await expect(flagged).to_have_count(required_count)
+            await expect(submit_btn).to_be_enabled()
+            await expect(submit_btn).to_have_text("Submit Project Inquiry")
             self.log_test("Empty Form Submission", "PASS", "Form validation prevented empty submission")
 
         except Exception as e:
             self.log_test("Empty Form Submission", "FAIL", str(e))
 
-    def test_invalid_email_format(self, page):
+    async def test_invalid_email_format(self, context):
         """Test invalid email formats"""
-        print("\n=== Testing Invalid Email Formats ===")
+        self.emit("\n=== Testing Invalid Email Formats ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
-            email_field = page.locator('#email')
-
             # Test various invalid formats
             invalid_emails = [
                 'notanemail',
@@ -67,76 +172,72 @@ class EdgeCaseVisualTester:
                 'spaces in@email.com'
             ]
 
-            for invalid_email in invalid_emails:
-                email_field.fill(invalid_email)
+            # Each format is checked on its own page, all at once
+            results = await asyncio.gather(*(
+                self.check_field_validity(context, '#email', invalid_email)
+                for invalid_email in invalid_emails
+            ))
 
-                # Try to submit
-                page.locator('button[type="submit"]').click()
-                page.wait_for_timeout(200)
-
-                # Should still be on same page due to validation
-                # (HTML5 email validation)
-                self.log_test(f"Invalid Email: {invalid_email}", "PASS", "Validation prevented submission")
+            for invalid_email, is_valid in zip(invalid_emails, results):
+                # HTML5 email validation blocks submission of invalid values
+                if is_valid:
+                    self.log_test(f"Invalid Email: {invalid_email}", "INFO", "Browser accepts this format")
+                else:
+                    self.log_test(f"Invalid Email: {invalid_email}", "PASS", "Validation prevented submission")
 
         except Exception as e:
             self.log_test("Invalid Email Format", "FAIL", str(e))
 
-    def test_very_long_text_input(self, page):
+    async def test_very_long_text_input(self, context):
         """Test form with very long text inputs"""
-        print("\n=== Testing Very Long Text Input ===")
+        page = await context.new_page()
+        self.emit("\n=== Testing Very Long Text Input ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
+            await self.open_form(page)
 
             # Create very long text (2000 characters)
             long_text = "Lorem ipsum dolor sit amet. " * 100
 
-            # Fill business description with long text
+            # Fill business description with long text, assigned in one
+            # message rather than sent through the input pipeline
             desc_field = page.locator('#business-description')
-            desc_field.fill(long_text)
+            await fill_form(page, {'#business-description': long_text})
 
             # Verify it was filled
-            filled_value = desc_field.input_value()
+            filled_value = await desc_field.input_value()
             assert len(filled_value) > 1000
             self.log_test("Very Long Text Input", "PASS", f"Accepted {len(filled_value)} characters")
 
             # Take screenshot
-            page.screenshot(path=f'{self.screenshot_dir}/long-text-input.png')
+            await page.screenshot(path=f'{self.screenshot_dir}/long-text-input.jpg', **SCREENSHOT_OPTIONS)
             self.log_test("Long Text Screenshot", "INFO", "Screenshot saved")
 
         except Exception as e:
             self.log_test("Very Long Text Input", "FAIL", str(e))
 
-    def test_special_characters_in_fields(self, page):
+    async def test_special_characters_in_fields(self, context):
         """Test special characters and unicode in text fields"""
-        print("\n=== Testing Special Characters ===")
+        page = await self.open_snapshot(context)
+        self.emit("\n=== Testing Special Characters ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
             # Test with special characters
             special_text = "Company™ & Co. <script>alert('test')</script> 中文 émojis 🎉"
 
             company_field = page.locator('#company')
-            company_field.fill(special_text)
+            await company_field.fill(special_text)
 
             # Verify it accepts the input
-            filled_value = company_field.input_value()
+            filled_value = await company_field.input_value()
             assert 'Company™' in filled_value
             self.log_test("Special Characters", "PASS", "Accepted special characters and unicode")
 
         except Exception as e:
             self.log_test("Special Characters", "FAIL", str(e))
 
-    def test_url_validation(self, page):
+    async def test_url_validation(self, context):
         """Test URL field validation"""
-        print("\n=== Testing URL Validation ===")
+        self.emit("\n=== Testing URL Validation ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
-            website_field = page.locator('#current-website')
-
             # Test valid URLs
             valid_urls = [
                 'https://example.com',
@@ -144,141 +245,141 @@ class EdgeCaseVisualTester:
                 'https://subdomain.example.co.uk'
             ]
 
-            for url in valid_urls:
-                website_field.fill(url)
-                assert website_field.input_value() == url
-                self.log_test(f"Valid URL: {url}", "PASS", "URL accepted")
-
             # Test invalid URLs (HTML5 URL validation)
             invalid_urls = [
                 'not-a-url',
                 'ftp://invalid',  # Only http/https typically accepted
             ]
 
-            for url in invalid_urls:
-                website_field.fill(url)
+            results = await asyncio.gather(*(
+                self.check_field_validity(context, '#current-website', url)
+                for url in valid_urls + invalid_urls
+            ))
+            valid_results = results[:len(valid_urls)]
+            invalid_results = results[len(valid_urls):]
+
+            for url, is_valid in zip(valid_urls, valid_results):
+                if is_valid:
+                    self.log_test(f"Valid URL: {url}", "PASS", "URL accepted")
+                else:
+                    self.log_test(f"Valid URL: {url}", "FAIL", "URL rejected by browser validation")
+
+            for url, is_valid in zip(invalid_urls, invalid_results):
                 # Note: Some browsers may accept these, validation varies
-                self.log_test(f"Invalid URL: {url}", "INFO", "URL input behavior tested")
+                behavior = "accepted" if is_valid else "rejected"
+                self.log_test(f"Invalid URL: {url}", "INFO", f"URL {behavior} by browser validation")
 
         except Exception as e:
             self.log_test("URL Validation", "FAIL", str(e))
 
-    def test_visual_snapshots(self, page):
+    async def test_visual_snapshots(self, context):
         """Capture visual snapshots of different form states"""
-        print("\n=== Capturing Visual Snapshots ===")
+        page = await context.new_page()
+        self.emit("\n=== Capturing Visual Snapshots ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
+            await self.open_form(page, wait_until='load')
+
+            name_field = page.locator('#name')
 
             # 1. Empty form
-            page.screenshot(path=f'{self.screenshot_dir}/01-empty-form.png', full_page=True)
+            await page.screenshot(path=f'{self.screenshot_dir}/01-empty-form.jpg', full_page=True, **SCREENSHOT_OPTIONS)
             self.log_test("Snapshot: Empty Form", "INFO", "Screenshot saved")
 
             # 2. Partially filled form
-            page.locator('#name').fill('John Doe')
-            page.locator('#email').fill('john@example.com')
-            page.locator('#company').fill('Tech Corp')
-            page.screenshot(path=f'{self.screenshot_dir}/02-partial-form.png', full_page=True)
+            await fill_form(page, PARTIAL_FORM_DATA)
+            await page.screenshot(path=f'{self.screenshot_dir}/02-partial-form.jpg', full_page=True, **SCREENSHOT_OPTIONS)
             self.log_test("Snapshot: Partial Fill", "INFO", "Screenshot saved")
 
             # 3. All fields filled
-            page.locator('#phone').fill('555-1234')
-            page.locator('#business-description').fill('We build amazing software')
-            page.locator('#current-website').fill('https://techcorp.example.com')
-            page.locator('#project-type').select_option('standard-site')
-            page.locator('#pages-needed').fill('Home, About, Services, Contact')
-            page.locator('#features').fill('Blog, Contact form, Gallery')
-            page.locator('input[name="has-logo"][value="yes"]').check()
-            page.locator('input[name="has-photos"][value="yes"]').check()
-            page.locator('input[name="has-copy"][value="yes"]').check()
-            page.locator('#inspiration').fill('https://stripe.com\nhttps://linear.app')
-            page.locator('#timeline').select_option('2-4-weeks')
-            page.locator('#budget').select_option('4k-6k')
-            page.locator('input[name="post-launch"][value="maintenance"]').check()
-            page.locator('#additional').fill('Looking forward to working together!')
-            page.locator('#referral').fill('LinkedIn')
-
-            page.screenshot(path=f'{self.screenshot_dir}/03-complete-form.png', full_page=True)
+            await fill_form(page, COMPLETE_FORM_DATA)
+
+            await page.screenshot(path=f'{self.screenshot_dir}/03-complete-form.jpg', full_page=True, **SCREENSHOT_OPTIONS)
             self.log_test("Snapshot: Complete Form", "INFO", "Screenshot saved")
 
             # 4. Focus state
-            page.locator('#name').focus()
-            page.screenshot(path=f'{self.screenshot_dir}/04-field-focus.png')
+            await name_field.focus()
+
+            # Only the focused field matters; keep a margin for the focus ring
+            box = await name_field.bounding_box()
+            clip = {
+                'x': max(box['x'] - 16, 0),
+                'y': max(box['y'] - 16, 0),
+                'width': box['width'] + 32,
+                'height': box['height'] + 32,
+            }
+            await page.screenshot(path=f'{self.screenshot_dir}/04-field-focus.jpg', clip=clip, **SCREENSHOT_OPTIONS)
             self.log_test("Snapshot: Field Focus", "INFO", "Screenshot saved")
 
         except Exception as e:
             self.log_test("Visual Snapshots", "FAIL", str(e))
 
-    def test_mobile_viewport_interactions(self, page):
+    async def test_mobile_viewport_interactions(self, context):
         """Test form interactions on mobile viewport"""
-        print("\n=== Testing Mobile Viewport Interactions ===")
+        page = await context.new_page()
+        self.emit("\n=== Testing Mobile Viewport Interactions ===")
         try:
             # Set to iPhone viewport
-            page.set_viewport_size({"width": 390, "height": 844})
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
+            await page.set_viewport_size({"width": 390, "height": 844})
+            await self.open_form(page)
 
             # Test scrolling to sections
-            page.locator('#business-description').scroll_into_view_if_needed()
-            page.wait_for_timeout(200)
+            await page.locator('#business-description').scroll_into_view_if_needed()
 
             # Fill a field on mobile
-            page.locator('#name').fill('Mobile User')
-            assert page.locator('#name').input_value() == 'Mobile User'
+            name_field = page.locator('#name')
+            await name_field.fill('Mobile User')
+            assert await name_field.input_value() == 'Mobile User'
 
             # Take mobile screenshot
-            page.screenshot(path=f'{self.screenshot_dir}/05-mobile-view.png', full_page=True)
+            await page.screenshot(path=f'{self.screenshot_dir}/05-mobile-view.jpg', full_page=True, **SCREENSHOT_OPTIONS)
             self.log_test("Mobile Viewport", "PASS", "Form functional on mobile")
 
         except Exception as e:
             self.log_test("Mobile Viewport Interactions", "FAIL", str(e))
 
-    def test_rapid_field_changes(self, page):
+    async def test_rapid_field_changes(self, context):
         """Test rapidly changing field values"""
-        print("\n=== Testing Rapid Field Changes ===")
+        page = await self.open_snapshot(context)
+        self.emit("\n=== Testing Rapid Field Changes ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
             name_field = page.locator('#name')
 
             # Rapidly change values
             for i in range(10):
-                name_field.fill(f'Name {i}')
+                await name_field.fill(f'Name {i}')
 
             # Final value should be the last one
-            assert name_field.input_value() == 'Name 9'
+            assert await name_field.input_value() == 'Name 9'
             self.log_test("Rapid Field Changes", "PASS", "Form handles rapid changes")
 
         except Exception as e:
             self.log_test("Rapid Field Changes", "FAIL", str(e))
 
-    def test_tab_navigation(self, page):
+    async def test_tab_navigation(self, context):
         """Test keyboard navigation through form"""
-        print("\n=== Testing Tab Navigation ===")
+        page = await context.new_page()
+        self.emit("\n=== Testing Tab Navigation ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
+            await self.open_form(page)
 
             # Focus first field
-            page.locator('#name').focus()
+            await page.locator('#name').focus()
 
             # Tab through several fields
             for i in range(5):
-                page.keyboard.press('Tab')
-                page.wait_for_timeout(100)
+                await page.keyboard.press('Tab')
 
             self.log_test("Tab Navigation", "PASS", "Keyboard navigation works")
 
         except Exception as e:
             self.log_test("Tab Navigation", "FAIL", str(e))
 
-    def test_accessibility_features(self, page):
+    async def test_accessibility_features(self, context):
         """Test accessibility features like labels and ARIA attributes"""
-        print("\n=== Testing Accessibility Features ===")
+        page = await context.new_page()
+        self.emit("\n=== Testing Accessibility Features ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
+            await self.open_form(page)
 
             # Check that all inputs have associated labels
             required_fields = ['name', 'email', 'company', 'business-description', 'project-type']
@@ -286,29 +387,31 @@ class EdgeCaseVisualTester:
             for field_id in required_fields:
                 # Check label exists
                 label = page.locator(f'label[for="{field_id}"]')
-                expect(label).to_be_visible()
+                await expect(label).to_be_visible()
                 self.log_test(f"Label for {field_id}", "PASS", "Label exists and visible")
 
         except Exception as e:
             self.log_test("Accessibility Features", "FAIL", str(e))
 
-    def test_form_persistence_on_reload(self, page):
+    async def test_form_persistence_on_reload(self, context):
         """Test if form data persists on page reload (should not by default)"""
-        print("\n=== Testing Form Persistence ===")
+        page = await context.new_page()
+        self.emit("\n=== Testing Form Persistence ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
+            await self.open_form(page)
 
             # Fill some fields
-            page.locator('#name').fill('Test User')
-            page.locator('#email').fill('test@example.com')
+            # Locators are lazy, so the same handle resolves again after reload
+            name_field = page.locator('#name')
+            await name_field.fill('Test User')
+            await page.locator('#email').fill('test@example.com')
 
             # Reload page
-            page.reload()
-            page.wait_for_load_state('networkidle')
+            await page.reload(wait_until='domcontentloaded')
+            await expect(name_field).to_be_visible()
 
             # Check if fields are empty (expected behavior without persistence)
-            name_value = page.locator('#name').input_value()
+            name_value = await name_field.input_value()
             if name_value == '':
                 self.log_test("Form Persistence", "PASS", "Form resets on reload (expected)")
             else:
@@ -319,62 +422,87 @@ class EdgeCaseVisualTester:
 
     def generate_report(self):
         """Generate test summary report"""
-        print("\n" + "="*60)
-        print("EDGE CASE & VISUAL TEST REPORT")
-        print("="*60)
-
-        passed = sum(1 for r in self.test_results if r['status'] == 'PASS')
-        failed = sum(1 for r in self.test_results if r['status'] == 'FAIL')
-        info = sum(1 for r in self.test_results if r['status'] == 'INFO')
-        total = len(self.test_results)
+        super().generate_report()
+        print(f"Screenshots saved to: {self.screenshot_dir}")
+
+    async def run_tests(self, test_names):
+        """Run the named tests concurrently against a single browser"""
+        tests = [getattr(self, name) for name in test_names]
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            await self.warm_up(browser)
+            semaphore = asyncio.Semaphore(MAX_PARALLEL_TESTS)
+
+            async def run_isolated(test):
+                # Each test gets its own context so cookies, viewport and
+                # page state never leak between concurrently running tests
+                lines = []
+                test_output.set(lines)
+                async with semaphore:
+                    context = await browser.new_context(storage_state=self.storage_state)
+                    if test != self.test_visual_snapshots:
+                        await context.route(HEAVY_ASSET_GLOB, block_heavy_assets)
+                    try:
+                        await test(context)
+                    finally:
+                        await context.close()
+                # One write per test keeps its header and results together,
+                # whatever else runs alongside it in this or other workers
+                sys.stdout.write('\n'.join(lines) + '\n')
+                sys.stdout.flush()
 
-        print(f"\nTotal Tests: {total}")
-        print(f"Passed: {passed} ✓")
-        print(f"Failed: {failed} ✗")
-        print(f"Info: {info} ℹ")
-
-        print(f"\nScreenshots saved to: {self.screenshot_dir}")
+            # Run tests
+            await asyncio.gather(*(run_isolated(test) for test in tests))
 
-        if failed > 0:
-            print("\n❌ FAILED TESTS:")
-            for result in self.test_results:
-                if result['status'] == 'FAIL':
-                    print(f"  - {result['test']}: {result['details']}")
-        else:
-            print("\n✅ ALL TESTS PASSED!")
+            await browser.close()
 
-        print("\n" + "="*60)
+    def run_all_tests(self, test_names=None):
+        """Run all edge case and visual tests, or just the named ones
 
-    def run_all_tests(self):
-        """Run all edge case and visual tests"""
+        Returns True when no test failed.
+        """
         print("Starting Edge Case & Visual Tests")
         print("="*60)
 
         # Setup
         self.setup_screenshot_dir()
+        test_names = tuple(test_names or self.TESTS)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        # Shard the suite round-robin across processes, each with its own browser.
+        # Workers are async end to end and exist to run MAX_PARALLEL_TESTS
+        # tests at once, so don't spawn more than it takes to fill them;
+        # a one-test shard would pay for an event loop and a browser for nothing.
+        workers = min(math.ceil(len(test_names) / MAX_PARALLEL_TESTS), os.cpu_count() or 1)
+        shards = [(self.base_url, self.screenshot_dir, test_names[i::workers]) for i in range(workers)]
 
-            # Run tests
-            self.test_empty_form_submission(page)
-            self.test_invalid_email_format(page)
-            self.test_very_long_text_input(page)
-            self.test_special_characters_in_fields(page)
-            self.test_url_validation(page)
-            self.test_visual_snapshots(page)
-            self.test_mobile_viewport_interactions(page)
-            self.test_rapid_field_changes(page)
-            self.test_tab_navigation(page)
-            self.test_accessibility_features(page)
-            self.test_form_persistence_on_reload(page)
-
-            browser.close()
+        with Pool(processes=workers) as pool:
+            for results in pool.starmap(run_shard, shards):
+                self.merge_results(results)
 
         # Generate report
         self.generate_report()
+        return self.counts['FAIL'] == 0
+
+def run_shard(base_url, screenshot_dir, test_names):
+    """Worker process entrypoint: run a slice of the suite and return its results
+
+    The worker's only event loop; nothing below it touches the sync API.
+    """
+    tester = EdgeCaseVisualTester(base_url)
+    tester.screenshot_dir = screenshot_dir
+    asyncio.run(tester.run_tests(test_names))
+    return tester.test_results
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('tests', nargs='*', metavar='TEST',
+                        help='only run the named tests (default: all)')
+    args = parser.parse_args()
+
+    unknown = set(args.tests) - set(EdgeCaseVisualTester.TESTS)
+    if unknown:
+        parser.error(f"unknown tests: {', '.join(sorted(unknown))}")
+
     tester = EdgeCaseVisualTester()
-    tester.run_all_tests()
+    sys.exit(0 if tester.run_all_tests(args.tests) else 1)
@@ -5,32 +5,249 @@ Tests all form fields, validations, file uploads, and submission flow
 """
 
 from playwright.sync_api import sync_playwright, expect
-import time
+from base_tester import CHROMIUM_ARGS, BaseTester, fill_form
+from multiprocessing import Pool
+from pathlib import Path
+import argparse
+import math
 import os
-
-class IntakeFormTester:
-    def __init__(self, base_url='http://localhost:5173'):
-        self.base_url = base_url
-        self.test_results = []
-
-    def log_test(self, test_name, status, details=""):
-        """Log test result"""
-        result = {
-            'test': test_name,
-            'status': status,
-            'details': details
+import re
+import subprocess
+import sys
+import urllib.request
+
+# Per-user home of the browser --keep-browser-open leaves running: the file
+# recording its DevTools endpoint, its profile and its stderr log. Kept out of
+# the shared temp dir so no other user's files can redirect a run.
+KEPT_BROWSER_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'intake-tests'
+BROWSER_ENDPOINT_FILE = KEPT_BROWSER_DIR / 'pw.ws'
+KEPT_PROFILE_DIR = KEPT_BROWSER_DIR / 'pw-keep-profile'
+KEPT_BROWSER_LOG = KEPT_BROWSER_DIR / 'pw-keep.log'
+
+def read_kept_endpoint():
+    """Return the recorded endpoint of the kept-open browser, or None"""
+    try:
+        return BROWSER_ENDPOINT_FILE.read_text().strip() or None
+    except OSError:
+        return None
+
+def close_kept_browser():
+    """Close the kept-open browser over its own DevTools endpoint and forget it
+
+    Returns whether a browser answered there and was closed.
+    """
+    endpoint = read_kept_endpoint()
+    BROWSER_ENDPOINT_FILE.unlink(missing_ok=True)
+    if not endpoint:
+        return False
+    with sync_playwright() as p:
+        try:
+            browser = p.chromium.connect_over_cdp(endpoint, timeout=5000)
+        except Exception:
+            return False  # Already gone
+        browser.new_browser_cdp_session().send('Browser.close')
+    return True
+
+def kept_browser_endpoint(executable_path):
+    """Return the endpoint of the kept-open browser, starting one if none answers"""
+    endpoint = read_kept_endpoint()
+    if endpoint:
+        try:
+            urllib.request.urlopen(f'{endpoint}/json/version', timeout=5).close()
+            return endpoint
+        except OSError:
+            BROWSER_ENDPOINT_FILE.unlink(missing_ok=True)  # Stale; start afresh
+
+    # Chromium writes the port it picked to this file once DevTools is
+    # listening. Clear a previous run's copy so its port is never read back.
+    KEPT_BROWSER_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    port_file = KEPT_PROFILE_DIR / 'DevToolsActivePort'
+    port_file.unlink(missing_ok=True)
+
+    # Start Chromium in its own session so it outlives this run. Its stderr
+    # goes to a file, which it can keep writing to after we exit.
+    with open(KEPT_BROWSER_LOG, 'ab') as log:
+        proc = subprocess.Popen(
+            [executable_path, '--headless=new', '--remote-debugging-port=0',
+             f'--user-data-dir={KEPT_PROFILE_DIR}', *CHROMIUM_ARGS, 'about:blank'],
+            stdout=subprocess.DEVNULL, stderr=log, start_new_session=True,
+        )
+
+    # Check for the port file every 100ms for up to 30s, waiting on the
+    # process in between so an early exit is noticed straight away
+    for _ in range(300):
+        lines = port_file.read_text().splitlines() if port_file.exists() else []
+        if lines and lines[0].isdigit():
+            break
+        try:
+            proc.wait(timeout=0.1)
+        except subprocess.TimeoutExpired:
+            continue
+        # A browser still running on this profile (e.g. one that stopped
+        # answering) makes the new one hand off to it and exit
+        raise RuntimeError(
+            f"Chromium exited before exposing a DevTools endpoint; see {KEPT_BROWSER_LOG}. "
+            f"If an earlier kept-open browser still runs on {KEPT_PROFILE_DIR}, stop it first."
+        )
+    else:
+        proc.kill()
+        raise RuntimeError(f"Chromium didn't expose a DevTools endpoint in 30s; see {KEPT_BROWSER_LOG}")
+
+    endpoint = f'http://127.0.0.1:{lines[0]}'
+    BROWSER_ENDPOINT_FILE.write_text(endpoint)
+    return endpoint
+
+# Tests each worker process runs in turn, so a process spawn, browser launch
+# and form load pay for several tests rather than one
+TESTS_PER_WORKER = 3
+
+# Viewport each worker's context opens with, restored after tests that resize it
+DEFAULT_VIEWPORT = {'width': 1280, 'height': 800}
+
+# Locators for the elements the tests touch, keyed by name. Built once per
+# shard page.
+FIELD_SELECTORS = {
+    'form': '#intake-form',
+    'submit': 'button[type="submit"]',
+    'inspiration': '#inspiration',
+    'drop-zone': '#drop-zone',
+    'file-input': '#file-input',
+    'timeline': '#timeline',
+    'budget': '#budget',
+}
+
+# (selector, label) of every field the form marks as required
+REQUIRED_FIELDS = (
+    ('#name', 'Name'),
+    ('#email', 'Email'),
+    ('#company', 'Company'),
+    ('#business-description', 'Business Description'),
+    ('#project-type', 'Project Type'),
+)
+
+# (selector, value, log label, log message) for test_all_text_fields_batch
+TEXT_FIELDS = (
+    # Contact information
+    ('#name', 'John Smith', 'Name Field', 'Can fill and retrieve name'),
+    ('#email', 'john.smith@example.com', 'Email Field', 'Can fill and retrieve email'),
+    ('#phone', '555-123-4567', 'Phone Field', 'Can fill and retrieve phone'),
+    ('#company', 'Acme Corporation', 'Company Field', 'Can fill and retrieve company'),
+    # Business section
+    ('#business-description', 'We provide innovative software solutions for small businesses.', 'Business Description', 'Can fill textarea'),
+    ('#current-website', 'https://example.com', 'Current Website', 'Can fill URL field'),
+    # Project details
+    ('#project-type', 'simple-site', 'Project Type Select', 'Can select project type'),
+    ('#pages-needed', 'Home, About, Services, Contact, Portfolio', 'Pages Needed', 'Can list pages'),
+    ('#features', 'Contact form, Photo gallery, Google Maps integration', 'Features', 'Can list features'),
+    # Additional fields
+    ('#additional', 'Looking forward to working together!', 'Additional Details', 'Can fill additional details'),
+    ('#referral', 'LinkedIn', 'Referral Field', 'Can fill referral source'),
+)
+
+# (selector, log label, log message) checked in order by test_radio_button_groups;
+# the second logo option must replace the first
+RADIO_STEPS = (
+    ('input[name="has-logo"][value="yes"]', "Logo Radio - Yes", "Can select 'Yes'"),
+    ('input[name="has-logo"][value="need-design"]', "Logo Radio - Need Design", "Can change selection"),
+    ('input[name="has-photos"][value="yes"]', "Photos Radio - Yes", "Can select photos option"),
+    ('input[name="has-copy"][value="yes"]', "Copy Radio - Yes", "Can select copy option"),
+    ('input[name="post-launch"][value="maintenance"]', "Post-Launch Radio", "Can select maintenance option"),
+)
+
+# Checks each radio like a click would, returning its state right after the
+# check and the state of every radio once all have been checked
+CHECK_RADIOS_JS = """(selectors) => {
+    const radios = selectors.map(s => document.querySelector(s));
+    const onClick = radios.map(el => {
+        el.checked = true;
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+        return el.checked;
+    });
+    return [onClick, radios.map(el => el.checked)];
+}"""
+
+# Every field of the form, filled in one evaluate call by test_complete_form_fill
+COMPLETE_FORM_DATA = {
+    '#name': 'Jane Doe',
+    '#email': 'jane.doe@example.com',
+    '#phone': '555-987-6543',
+    '#company': 'Tech Innovations Inc',
+    '#business-description': 'We build cutting-edge mobile applications',
+    '#current-website': 'https://techinnovations.example.com',
+    '#project-type': 'standard-site',
+    '#pages-needed': 'Home, About, Services, Team, Contact, Blog',
+    '#features': 'Blog, Contact forms, Team profiles, Case studies',
+    # Radio options
+    'input[name="has-logo"][value="yes"]': True,
+    'input[name="has-photos"][value="some"]': True,
+    'input[name="has-copy"][value="rough"]': True,
+    # Design section
+    '#inspiration': 'https://apple.com\nhttps://airbnb.com',
+    # Timeline and budget
+    '#timeline': '2-4-weeks',
+    '#budget': '4k-6k',
+    # Post-launch
+    'input[name="post-launch"][value="maintenance"]': True,
+    # Additional
+    '#additional': 'Excited to get started!',
+    '#referral': 'Google Search',
+}
+
+# Snapshot of the whole form in one round-trip: values keyed by id, and
+# checked state for radios/checkboxes keyed as '<name>=<value>'
+READ_FORM_JS = """() => {
+    const state = {};
+    for (const el of document.getElementById('intake-form').elements) {
+        if (el.type === 'checkbox' || el.type === 'radio') {
+            state[`${el.name}=${el.value}`] = el.checked;
+        } else if (el.id) {
+            state[el.id] = el.value;
         }
-        self.test_results.append(result)
-        status_symbol = "✓" if status == "PASS" else "✗"
-        print(f"{status_symbol} {test_name}: {details}")
+    }
+    return state;
+}"""
+
+RADIO_SELECTOR = re.compile(r'input\[name="([^"]+)"\]\[value="([^"]+)"\]')
+
+def form_state_key(selector):
+    """Map a fill selector to its key in the READ_FORM_JS snapshot"""
+    radio = RADIO_SELECTOR.fullmatch(selector)
+    return '='.join(radio.groups()) if radio else selector.lstrip('#')
+
+class IntakeFormTester(BaseTester):
+    REPORT_TITLE = "TEST SUMMARY REPORT"
+    RESULTS_FILE = 'results.json'
+
+    TESTS = (
+        'test_required_fields_validation',
+        'test_all_text_fields_batch',
+        'test_radio_button_groups',
+        'test_design_section',
+        'test_file_upload_ui',
+        'test_timeline_and_budget_selects',
+        'test_navigation_links',
+        'test_complete_form_fill',
+        'test_form_responsiveness',
+    )
 
-    def test_page_load(self, page):
-        """Test that the page loads correctly"""
-        print("\n=== Testing Page Load ===")
+    def __init__(self, base_url='http://localhost:5173'):
+        super().__init__(base_url)
+        self.loc = {}
+        self.log_buf = []
+
+    def emit(self, line):
+        """Buffer progress output; run_tests writes it once per shard"""
+        self.log_buf.append(line)
+
+    def reset_form(self, page):
+        """Put the shared page back to a pristine form between tests"""
+        page.evaluate("document.getElementById('intake-form').reset()")
+        page.set_viewport_size(DEFAULT_VIEWPORT)
+
+    def check_page_load(self, page):
+        """Check the freshly loaded page; run once, by the first shard"""
+        self.emit("\n=== Testing Page Load ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
             # Check title
             title = page.title()
             assert "Project Intake" in title
@@ -42,7 +259,7 @@ class IntakeFormTester:
             self.log_test("Hero Section", "PASS", "Hero text displayed correctly")
 
             # Check form exists
-            form = page.locator('#intake-form')
+            form = self.loc['form']
             expect(form).to_be_visible()
             self.log_test("Form Visibility", "PASS", "Form is visible on page")
 
@@ -51,178 +268,85 @@ class IntakeFormTester:
 
     def test_required_fields_validation(self, page):
         """Test that required fields show validation errors"""
-        print("\n=== Testing Required Field Validations ===")
+        self.emit("\n=== Testing Required Field Validations ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
+            # Empty required fields match :invalid from the start, but only a
+            # submit attempt makes them :user-invalid
+            flagged = page.locator('#intake-form :is(input, select, textarea):user-invalid')
+            expect(flagged).to_have_count(0)
 
             # Try to submit empty form
-            submit_btn = page.locator('button[type="submit"]')
+            submit_btn = self.loc['submit']
             submit_btn.click()
 
-            # Check if browser validation prevents submission
-            # Required fields: name, email, company, business-description, project-type
-            required_fields = [
-                {'selector': '#name', 'label': 'Name'},
-                {'selector': '#email', 'label': 'Email'},
-                {'selector': '#company', 'label': 'Company'},
-                {'selector': '#business-description', 'label': 'Business Description'},
-                {'selector': '#project-type', 'label': 'Project Type'}
-            ]
-
-            for field in required_fields:
-                input_field = page.locator(field['selector'])
-                is_required = input_field.get_attribute('required')
-                if is_required is not None:
-                    self.log_test(f"Required: {field['label']}", "PASS", "Field marked as required")
+            # Browser validation flags every empty required control, and the
+            # submit handler never ran: it would have disabled and relabelled the button
+            expect(flagged).to_have_count(len(REQUIRED_FIELDS), timeout=1000)
+            expect(submit_btn).to_be_enabled()
+            expect(submit_btn).to_have_text("Submit Project Inquiry")
+            self.log_test("Empty Submit Blocked", "PASS", f"{len(REQUIRED_FIELDS)} required fields flagged, submit handler not run")
+
+            # Read every required flag in one round-trip
+            flags = page.evaluate(
+                "(sels) => sels.map(s => document.querySelector(s)?.required ?? false)",
+                [selector for selector, _ in REQUIRED_FIELDS],
+            )
+
+            for (_, label), is_required in zip(REQUIRED_FIELDS, flags):
+                if is_required:
+                    self.log_test(f"Required: {label}", "PASS", "Field marked as required")
                 else:
-                    self.log_test(f"Required: {field['label']}", "FAIL", "Field not marked as required")
+                    self.log_test(f"Required: {label}", "FAIL", "Field not marked as required")
 
         except Exception as e:
             self.log_test("Required Field Validation", "FAIL", str(e))
 
-    def test_contact_information_fields(self, page):
-        """Test all contact information fields"""
-        print("\n=== Testing Contact Information Fields ===")
-        try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
-            # Test Name field
-            name_field = page.locator('#name')
-            name_field.fill('John Smith')
-            assert name_field.input_value() == 'John Smith'
-            self.log_test("Name Field", "PASS", "Can fill and retrieve name")
-
-            # Test Email field
-            email_field = page.locator('#email')
-            email_field.fill('john.smith@example.com')
-            assert email_field.input_value() == 'john.smith@example.com'
-            self.log_test("Email Field", "PASS", "Can fill and retrieve email")
-
-            # Test Phone field (optional)
-            phone_field = page.locator('#phone')
-            phone_field.fill('555-123-4567')
-            assert phone_field.input_value() == '555-123-4567'
-            self.log_test("Phone Field", "PASS", "Can fill and retrieve phone")
-
-            # Test Company field
-            company_field = page.locator('#company')
-            company_field.fill('Acme Corporation')
-            assert company_field.input_value() == 'Acme Corporation'
-            self.log_test("Company Field", "PASS", "Can fill and retrieve company")
-
-        except Exception as e:
-            self.log_test("Contact Information Fields", "FAIL", str(e))
-
-    def test_business_section(self, page):
-        """Test business description and website fields"""
-        print("\n=== Testing Business Section ===")
+    def test_all_text_fields_batch(self, page):
+        """Fill every text field and select in one call, then verify them from one snapshot"""
+        self.emit("\n=== Testing Text Fields & Selects ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
-            # Test business description textarea
-            desc_field = page.locator('#business-description')
-            test_description = "We provide innovative software solutions for small businesses."
-            desc_field.fill(test_description)
-            assert desc_field.input_value() == test_description
-            self.log_test("Business Description", "PASS", "Can fill textarea")
-
-            # Test current website URL field
-            website_field = page.locator('#current-website')
-            website_field.fill('https://example.com')
-            assert website_field.input_value() == 'https://example.com'
-            self.log_test("Current Website", "PASS", "Can fill URL field")
-
-        except Exception as e:
-            self.log_test("Business Section", "FAIL", str(e))
+            fill_form(page, {selector: value for selector, value, _, _ in TEXT_FIELDS})
+            state = page.evaluate(READ_FORM_JS)
 
-    def test_project_details_section(self, page):
-        """Test project type, pages needed, and features fields"""
-        print("\n=== Testing Project Details Section ===")
-        try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
-            # Test project type select
-            project_type = page.locator('#project-type')
-            project_type.select_option('landing-page')
-            assert project_type.input_value() == 'landing-page'
-            self.log_test("Project Type Select", "PASS", "Can select landing page")
-
-            # Test other options
-            project_type.select_option('simple-site')
-            assert project_type.input_value() == 'simple-site'
-            self.log_test("Project Type Options", "PASS", "Can change selection")
-
-            # Test pages needed
-            pages_field = page.locator('#pages-needed')
-            pages_field.fill('Home, About, Services, Contact, Portfolio')
-            assert 'Home' in pages_field.input_value()
-            self.log_test("Pages Needed", "PASS", "Can list pages")
-
-            # Test features
-            features_field = page.locator('#features')
-            features_field.fill('Contact form, Photo gallery, Google Maps integration')
-            assert 'Contact form' in features_field.input_value()
-            self.log_test("Features", "PASS", "Can list features")
+            for selector, value, label, message in TEXT_FIELDS:
+                actual = state.get(form_state_key(selector))
+                if actual == value:
+                    self.log_test(label, "PASS", message)
+                else:
+                    self.log_test(label, "FAIL", f"Expected {value!r}, got {actual!r}")
 
         except Exception as e:
-            self.log_test("Project Details Section", "FAIL", str(e))
+            self.log_test("Text Fields & Selects", "FAIL", str(e))
 
     def test_radio_button_groups(self, page):
         """Test all radio button groups"""
-        print("\n=== Testing Radio Button Groups ===")
+        self.emit("\n=== Testing Radio Button Groups ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
-            # Test logo radio buttons
-            logo_yes = page.locator('input[name="has-logo"][value="yes"]')
-            logo_yes.check()
-            assert logo_yes.is_checked()
-            self.log_test("Logo Radio - Yes", "PASS", "Can select 'Yes'")
-
-            logo_need = page.locator('input[name="has-logo"][value="need-design"]')
-            logo_need.check()
-            assert logo_need.is_checked()
-            assert not logo_yes.is_checked()
-            self.log_test("Logo Radio - Need Design", "PASS", "Can change selection")
-
-            # Test photos radio buttons
-            photos_yes = page.locator('input[name="has-photos"][value="yes"]')
-            photos_yes.check()
-            assert photos_yes.is_checked()
-            self.log_test("Photos Radio - Yes", "PASS", "Can select photos option")
-
-            # Test copy radio buttons
-            copy_yes = page.locator('input[name="has-copy"][value="yes"]')
-            copy_yes.check()
-            assert copy_yes.is_checked()
-            self.log_test("Copy Radio - Yes", "PASS", "Can select copy option")
-
-            # Test post-launch radio buttons
-            post_maintenance = page.locator('input[name="post-launch"][value="maintenance"]')
-            post_maintenance.check()
-            assert post_maintenance.is_checked()
-            self.log_test("Post-Launch Radio", "PASS", "Can select maintenance option")
+            # Check each radio in order and read back every state in one call
+            selectors = [selector for selector, _, _ in RADIO_STEPS]
+            checked_on_click, checked_at_end = page.evaluate(CHECK_RADIOS_JS, selectors)
+
+            groups = [form_state_key(selector).split('=')[0] for selector in selectors]
+            for i, (selector, label, message) in enumerate(RADIO_STEPS):
+                # A radio stays checked unless a later step picks another in its group
+                superseded = groups[i] in groups[i + 1:]
+                if checked_on_click[i] and checked_at_end[i] != superseded:
+                    self.log_test(label, "PASS", message)
+                else:
+                    self.log_test(label, "FAIL", f"Unexpected checked state for {selector}")
 
         except Exception as e:
             self.log_test("Radio Button Groups", "FAIL", str(e))
 
     def test_design_section(self, page):
         """Test design inspiration field"""
-        print("\n=== Testing Design Section ===")
+        self.emit("\n=== Testing Design Section ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
             # Test inspiration textarea
-            inspiration = page.locator('#inspiration')
+            inspiration = self.loc['inspiration']
             test_urls = "https://stripe.com\nhttps://linear.app"
             inspiration.fill(test_urls)
-            assert 'stripe.com' in inspiration.input_value()
+            expect(inspiration).to_have_value(test_urls)
             self.log_test("Design Inspiration", "PASS", "Can add inspiration URLs")
 
         except Exception as e:
@@ -230,21 +354,18 @@ class IntakeFormTester:
 
     def test_file_upload_ui(self, page):
         """Test file upload drop zone and UI interactions"""
-        print("\n=== Testing File Upload UI ===")
+        self.emit("\n=== Testing File Upload UI ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
             # Check drop zone exists
-            drop_zone = page.locator('#drop-zone')
+            drop_zone = self.loc['drop-zone']
             expect(drop_zone).to_be_visible()
             self.log_test("Drop Zone Visibility", "PASS", "Drop zone is visible")
 
             # Check file input exists (hidden)
-            file_input = page.locator('#file-input')
-            assert file_input.get_attribute('type') == 'file'
-            assert file_input.get_attribute('accept') == 'image/*'
-            assert file_input.get_attribute('multiple') is not None
+            config = self.loc['file-input'].evaluate(
+                "el => ({type: el.type, accept: el.accept, multiple: el.multiple})"
+            )
+            assert config == {'type': 'file', 'accept': 'image/*', 'multiple': True}
             self.log_test("File Input Configuration", "PASS", "File input properly configured")
 
             # Note: Actual file upload testing would require creating test files
@@ -256,59 +377,29 @@ class IntakeFormTester:
 
     def test_timeline_and_budget_selects(self, page):
         """Test timeline and budget select fields"""
-        print("\n=== Testing Timeline & Budget Selects ===")
+        self.emit("\n=== Testing Timeline & Budget Selects ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
+            # select_option() returns what ended up selected, so no read-back is needed
             # Test timeline select
-            timeline = page.locator('#timeline')
-            timeline.select_option('asap')
-            assert timeline.input_value() == 'asap'
+            timeline = self.loc['timeline']
+            assert timeline.select_option('asap') == ['asap']
             self.log_test("Timeline Select - ASAP", "PASS", "Can select ASAP")
 
-            timeline.select_option('flexible')
-            assert timeline.input_value() == 'flexible'
+            assert timeline.select_option('flexible') == ['flexible']
             self.log_test("Timeline Select - Flexible", "PASS", "Can change to flexible")
 
             # Test budget select
-            budget = page.locator('#budget')
-            budget.select_option('2k-4k')
-            assert budget.input_value() == '2k-4k'
+            budget = self.loc['budget']
+            assert budget.select_option('2k-4k') == ['2k-4k']
             self.log_test("Budget Select", "PASS", "Can select budget range")
 
         except Exception as e:
             self.log_test("Timeline & Budget", "FAIL", str(e))
 
-    def test_additional_fields(self, page):
-        """Test additional details and referral fields"""
-        print("\n=== Testing Additional Fields ===")
-        try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
-            # Test additional details
-            additional = page.locator('#additional')
-            additional.fill('Looking forward to working together!')
-            assert 'forward' in additional.input_value()
-            self.log_test("Additional Details", "PASS", "Can fill additional details")
-
-            # Test referral field
-            referral = page.locator('#referral')
-            referral.fill('LinkedIn')
-            assert referral.input_value() == 'LinkedIn'
-            self.log_test("Referral Field", "PASS", "Can fill referral source")
-
-        except Exception as e:
-            self.log_test("Additional Fields", "FAIL", str(e))
-
     def test_navigation_links(self, page):
         """Test navigation links"""
-        print("\n=== Testing Navigation Links ===")
+        self.emit("\n=== Testing Navigation Links ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
             # Check nav logo link
             nav_logo = page.locator('nav a[href="https://briancline.co"]').first
             expect(nav_logo).to_be_visible()
@@ -325,45 +416,19 @@ class IntakeFormTester:
 
     def test_complete_form_fill(self, page):
         """Test filling out the entire form with valid data"""
-        print("\n=== Testing Complete Form Fill ===")
+        self.emit("\n=== Testing Complete Form Fill ===")
         try:
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
-            # Fill all required fields
-            page.locator('#name').fill('Jane Doe')
-            page.locator('#email').fill('jane.doe@example.com')
-            page.locator('#phone').fill('555-987-6543')
-            page.locator('#company').fill('Tech Innovations Inc')
-            page.locator('#business-description').fill('We build cutting-edge mobile applications')
-            page.locator('#current-website').fill('https://techinnovations.example.com')
-            page.locator('#project-type').select_option('standard-site')
-            page.locator('#pages-needed').fill('Home, About, Services, Team, Contact, Blog')
-            page.locator('#features').fill('Blog, Contact forms, Team profiles, Case studies')
-
-            # Select radio options
-            page.locator('input[name="has-logo"][value="yes"]').check()
-            page.locator('input[name="has-photos"][value="some"]').check()
-            page.locator('input[name="has-copy"][value="rough"]').check()
-
-            # Fill design section
-            page.locator('#inspiration').fill('https://apple.com\nhttps://airbnb.com')
-
-            # Timeline and budget
-            page.locator('#timeline').select_option('2-4-weeks')
-            page.locator('#budget').select_option('4k-6k')
-
-            # Post-launch
-            page.locator('input[name="post-launch"][value="maintenance"]').check()
-
-            # Additional
-            page.locator('#additional').fill('Excited to get started!')
-            page.locator('#referral').fill('Google Search')
-
-            # Verify all fields are filled
-            assert page.locator('#name').input_value() == 'Jane Doe'
-            assert page.locator('#project-type').input_value() == 'standard-site'
-            assert page.locator('input[name="has-logo"][value="yes"]').is_checked()
+            # Fill every field in a single round-trip
+            fill_form(page, COMPLETE_FORM_DATA)
+
+            # Verify all fields are filled against one snapshot of the form
+            state = page.evaluate(READ_FORM_JS)
+            mismatches = {
+                selector: state.get(form_state_key(selector))
+                for selector, value in COMPLETE_FORM_DATA.items()
+                if state.get(form_state_key(selector)) != value
+            }
+            assert not mismatches, f"Unexpected values: {mismatches}"
 
             self.log_test("Complete Form Fill", "PASS", "All fields filled successfully")
 
@@ -372,89 +437,127 @@ class IntakeFormTester:
 
     def test_form_responsiveness(self, page):
         """Test form at different viewport sizes"""
-        print("\n=== Testing Form Responsiveness ===")
+        self.emit("\n=== Testing Form Responsiveness ===")
         try:
+            # Media queries re-evaluate on resize, so no reload is needed
+            form = self.loc['form']
+
             # Test mobile viewport
             page.set_viewport_size({"width": 375, "height": 667})
-            page.goto(self.base_url)
-            page.wait_for_load_state('networkidle')
-
-            form = page.locator('#intake-form')
             expect(form).to_be_visible()
             self.log_test("Mobile Responsiveness", "PASS", "Form visible on mobile")
 
             # Test tablet viewport
             page.set_viewport_size({"width": 768, "height": 1024})
-            page.reload()
-            page.wait_for_load_state('networkidle')
             expect(form).to_be_visible()
             self.log_test("Tablet Responsiveness", "PASS", "Form visible on tablet")
 
             # Test desktop viewport
             page.set_viewport_size({"width": 1920, "height": 1080})
-            page.reload()
-            page.wait_for_load_state('networkidle')
             expect(form).to_be_visible()
             self.log_test("Desktop Responsiveness", "PASS", "Form visible on desktop")
 
         except Exception as e:
             self.log_test("Form Responsiveness", "FAIL", str(e))
 
-    def generate_report(self):
-        """Generate test summary report"""
-        print("\n" + "="*60)
-        print("TEST SUMMARY REPORT")
-        print("="*60)
+    def run_tests(self, test_names, check_load=False, endpoint=None):
+        """Run the named tests one after another against a single browser
 
-        passed = sum(1 for r in self.test_results if r['status'] == 'PASS')
-        failed = sum(1 for r in self.test_results if r['status'] == 'FAIL')
-        info = sum(1 for r in self.test_results if r['status'] == 'INFO')
-        total = len(self.test_results)
-
-        print(f"\nTotal Tests: {total}")
-        print(f"Passed: {passed} ✓")
-        print(f"Failed: {failed} ✗")
-        print(f"Info: {info} ℹ")
-
-        if failed > 0:
-            print("\n❌ FAILED TESTS:")
-            for result in self.test_results:
-                if result['status'] == 'FAIL':
-                    print(f"  - {result['test']}: {result['details']}")
-        else:
-            print("\n✅ ALL TESTS PASSED!")
+        With an endpoint, attach to that already-running browser instead of
+        launching one; closing it then only disconnects.
+        """
+        # Tests catch their own errors, so anything raised here is the
+        # shard's setup, a reset or teardown. Log it as a failure so the
+        # parent still gets results and writes its report.
+        pending = list(test_names)
+        try:
+            with sync_playwright() as p:
+                if endpoint:
+                    browser = p.chromium.connect_over_cdp(endpoint)
+                else:
+                    browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+
+                # The form is static, so load it once per shard and reset its
+                # fields between tests instead of navigating again each time.
+                # open_form() waits for DOMContentLoaded and a rendered widget;
+                # nothing here depends on the network going idle.
+                context = self.new_context(browser, viewport=DEFAULT_VIEWPORT)
+                page = context.new_page()
+                self.open_form(page)
+                self.loc = {key: page.locator(sel) for key, sel in FIELD_SELECTORS.items()}
+
+                # Every shard loads the same page; only one needs to report on it
+                if check_load:
+                    self.check_page_load(page)
+
+                for name in test_names:
+                    getattr(self, name)(page)
+                    pending.remove(name)
+                    self.reset_form(page)
+
+                context.close()
+                browser.close()
+        except Exception as e:
+            self.log_test("Shard Error", "FAIL", f"{e} (not run: {', '.join(pending) or 'none'})")
+        finally:
+            # One write per shard also keeps workers' output from interleaving
+            sys.stdout.write('\n'.join(self.log_buf) + '\n')
+            sys.stdout.flush()
 
-        print("\n" + "="*60)
+    def run_all_tests(self, test_names=None, keep_browser_open=False):
+        """Run all tests, or just the named ones
 
-    def run_all_tests(self):
-        """Run all tests"""
+        Returns True when no test failed.
+        """
         print("Starting Intake Form Test Suite")
         print("="*60)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-
-            # Run all test methods
-            self.test_page_load(page)
-            self.test_required_fields_validation(page)
-            self.test_contact_information_fields(page)
-            self.test_business_section(page)
-            self.test_project_details_section(page)
-            self.test_radio_button_groups(page)
-            self.test_design_section(page)
-            self.test_file_upload_ui(page)
-            self.test_timeline_and_budget_selects(page)
-            self.test_additional_fields(page)
-            self.test_navigation_links(page)
-            self.test_complete_form_fill(page)
-            self.test_form_responsiveness(page)
-
-            browser.close()
+        # Workers share one long-lived browser instead of each launching their own
+        endpoint = None
+        if keep_browser_open:
+            with sync_playwright() as p:
+                endpoint = kept_browser_endpoint(p.chromium.executable_path)
+            print(f"Using kept-open browser at {endpoint}")
+
+        # Shard the suite round-robin across processes, each with its own browser
+        test_names = tuple(test_names or self.TESTS)
+        workers = min(math.ceil(len(test_names) / TESTS_PER_WORKER), os.cpu_count() or 1)
+        shards = [(self.base_url, test_names[i::workers], i == 0, endpoint) for i in range(workers)]
+
+        with Pool(processes=workers) as pool:
+            for results in pool.starmap(run_shard, shards):
+                self.merge_results(results)
 
         # Generate report
         self.generate_report()
+        return self.counts['FAIL'] == 0
+
+def run_shard(base_url, test_names, check_load, endpoint):
+    """Worker process entrypoint: run a slice of the suite and return its results"""
+    tester = IntakeFormTester(base_url)
+    tester.run_tests(test_names, check_load, endpoint)
+    return tester.test_results
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('tests', nargs='*', metavar='TEST',
+                        help='only run the named tests (default: all)')
+    parser.add_argument('--keep-browser-open', action='store_true',
+                        help='reuse (or start) a background browser across runs')
+    parser.add_argument('--close-kept-browser', action='store_true',
+                        help='stop the background browser --keep-browser-open left running, then exit')
+    args = parser.parse_args()
+
+    if args.close_kept_browser:
+        if close_kept_browser():
+            print("Closed the kept-open browser")
+        else:
+            print("No kept-open browser was running")
+        sys.exit(0)
+
+    unknown = set(args.tests) - set(IntakeFormTester.TESTS)
+    if unknown:
+        parser.error(f"unknown tests: {', '.join(sorted(unknown))}")
+
     tester = IntakeFormTester()
-    tester.run_all_tests()
+    sys.exit(0 if tester.run_all_tests(args.tests, args.keep_browser_open) else 1)